@@ -11,7 +11,7 @@ import json
 from math import radians, sin, cos, sqrt, atan2
 from analise_csv import processar_arquivo
 from busca_google import buscar_fornecedores_google
-from extrair_cnpj import extrair_cnpj_do_site
+from extrair_cnpj import extrair_cnpj_com_metricas
 from avaliar_reputacao import avaliar_reputacao_snippet
 from classificacao import classificar_fornecedor
 from pagamento_garantido import calcular_custo_total, simular_comparativo_fornecedores
@@ -99,7 +99,14 @@ if st.button("🔍 Buscar fornecedores no Google"):
                     if negativas:
                         st.markdown(f"🔴 Palavras negativas: `{', '.join(negativas)}`")
 
-                    cnpj = extrair_cnpj_do_site(fornecedor['link'])
+                    extracao = extrair_cnpj_com_metricas(fornecedor['link'])
+                    st.caption(
+                        f"📥 {extracao['bytes_baixados'] / 1024:.0f} KB baixados em "
+                        f"{extracao['tempo_s']:.2f}s ({len(extracao['paginas_visitadas'])} página(s))"
+                    )
+
+                    # só chega aqui CNPJ com dígitos verificadores válidos
+                    cnpj = extracao["cnpj"]
                     if cnpj:
                         cnpj_limpo = re.sub(r'\D', '', cnpj)
                         st.markdown(f"🔢 **CNPJ detectado:** `{cnpj}`")
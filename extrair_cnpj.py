@@ -0,0 +1,258 @@
+import re
+import time
+import requests
+from urllib.parse import urljoin, urlparse, urlunparse
+
+# ----------------------------
+# CONFIGURAÇÕES DA EXTRAÇÃO
+# ----------------------------
+LIMITE_BYTES_POR_PAGINA = 256 * 1024   # não baixa mais que 256 KB (trafegados) de cada página
+LIMITE_BYTES_POR_SITE = 768 * 1024     # teto somando todas as páginas do site
+TAMANHO_CHUNK = 16 * 1024
+MAX_PAGINAS_EXTRAS = 3                 # páginas "contato"/"sobre" seguidas no máximo
+TIMEOUT = 10                           # timeout de conexão/leitura de cada requisição
+TEMPO_LIMITE_POR_SITE = 20             # tempo total máximo gasto em um site (segundos)
+SOBREPOSICAO = 512                     # trecho mantido entre chunks (CNPJ/link partido ao meio)
+
+# Em ordem de prioridade: páginas de contato primeiro
+PALAVRAS_PAGINAS_PROVAVEIS = ("contato", "fale-conosco", "quem-somos", "sobre", "empresa", "institucional")
+
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; AgenteFornecedor/1.0)"}
+
+# Padrões pré-compilados:
+# - formatado "00.000.000/0000-00" vale em qualquer ponto da página;
+# - sem formatação (ou parcial) só vale logo após o rótulo "CNPJ", para não
+#   confundir com GTIN/EAN, SKU, códigos de rastreio etc.
+CNPJ_FORMATADO_REGEX = re.compile(r"(?<!\d)\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}(?!\d)")
+CNPJ_ROTULADO_REGEX = re.compile(
+    r"CNPJ\D{0,20}?(?<!\d)(\d{2}\.?\d{3}\.?\d{3}/?\d{4}-?\d{2})(?!\d)", re.IGNORECASE
+)
+HREF_REGEX = re.compile(r"""href\s*=\s*["']([^"'#]+)["']""", re.IGNORECASE)
+PAGINA_PROVAVEL_REGEX = re.compile(
+    r"^(" + "|".join(PALAVRAS_PAGINAS_PROVAVEIS) + r")(?:[-_.]|$)", re.IGNORECASE
+)
+
+
+# ----------------------------
+# VALIDAÇÃO LOCAL DO CNPJ
+# ----------------------------
+def validar_cnpj(cnpj: str) -> bool:
+    """
+    Confere os dígitos verificadores do CNPJ localmente,
+    sem nenhuma chamada de rede.
+    """
+    digitos = [int(d) for d in str(cnpj) if d.isdigit()]
+    if len(digitos) != 14 or len(set(digitos)) == 1:
+        return False
+
+    for posicao in (12, 13):
+        pesos = list(range(posicao - 7, 1, -1)) + list(range(9, 1, -1))
+        soma = sum(d * p for d, p in zip(digitos[:posicao], pesos))
+        resto = soma % 11
+        dv = 0 if resto < 2 else 11 - resto
+        if digitos[posicao] != dv:
+            return False
+    return True
+
+
+def formatar_cnpj(cnpj: str) -> str:
+    """Formata 14 dígitos no padrão 00.000.000/0000-00."""
+    d = "".join(filter(str.isdigit, str(cnpj)))
+    return f"{d[:2]}.{d[2:5]}.{d[5:8]}/{d[8:12]}-{d[12:]}"
+
+
+def buscar_cnpj_no_texto(texto: str):
+    """
+    Retorna o primeiro CNPJ válido do texto, ou None.
+    CNPJs formatados têm prioridade; números soltos só contam se rotulados como "CNPJ".
+    """
+    for match in CNPJ_FORMATADO_REGEX.finditer(texto):
+        if validar_cnpj(match.group()):
+            return formatar_cnpj(match.group())
+
+    for match in CNPJ_ROTULADO_REGEX.finditer(texto):
+        if validar_cnpj(match.group(1)):
+            return formatar_cnpj(match.group(1))
+    return None
+
+
+# ----------------------------
+# LINKS / DOMÍNIO
+# ----------------------------
+def _host(url):
+    """Host sem o prefixo "www.", para comparar domínios após redirecionamentos."""
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _normalizar_url(url):
+    """Remove fragmento e barra final, para que "contato" e "/contato/" contem como a mesma página."""
+    partes = urlparse(url)
+    caminho = partes.path.rstrip("/") or "/"
+    return urlunparse((partes.scheme.lower(), partes.netloc.lower(), caminho, partes.params, partes.query, ""))
+
+
+def _prioridade_link(url):
+    """
+    Posição da palavra-chave em PALAVRAS_PAGINAS_PROVAVEIS, olhando só o último
+    segmento do caminho (evita "/sobremesa" e "/blog/como-escolher-empresa-...").
+    Retorna None se o link não parece uma página de contato/institucional.
+    """
+    segmento = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+    match = PAGINA_PROVAVEL_REGEX.match(segmento)
+    if not match:
+        return None
+    return PALAVRAS_PAGINAS_PROVAVEIS.index(match.group(1).lower())
+
+
+# ----------------------------
+# LEITURA EM STREAMING
+# ----------------------------
+def _bytes_trafegados(resp, fallback):
+    """Bytes realmente recebidos pela rede (antes de descompactar gzip/br)."""
+    try:
+        return resp.raw.tell()
+    except Exception:
+        return fallback
+
+
+def _ler_chunks(resp):
+    """
+    Lê o corpo em pedaços de até TAMANHO_CHUNK, devolvendo o que já chegou pela rede
+    (read1), para que o prazo do site seja conferido mesmo com servidores lentos.
+    """
+    if hasattr(resp.raw, "read1"):
+        while True:
+            chunk = resp.raw.read1(TAMANHO_CHUNK, decode_content=True)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from resp.iter_content(chunk_size=TAMANHO_CHUNK)
+
+
+def _varrer_pagina(url, limite_bytes, prazo, coletar_links=True):
+    """
+    Baixa a página em chunks até achar um CNPJ válido, atingir o limite de bytes
+    ou estourar o prazo (time.perf_counter()) do site.
+    Retorna (cnpj_valido_ou_None, bytes_baixados, links_provaveis, url_final).
+    Os links já vêm resolvidos contra a URL final (após redirecionamentos) e normalizados.
+    """
+    bytes_descompactados = 0
+    bytes_baixados = 0
+    links = {}
+    buffer = ""
+    url_final = url
+
+    try:
+        timeout = max(0.1, min(TIMEOUT, prazo - time.perf_counter()))
+        with requests.get(url, headers=HEADERS, timeout=timeout, stream=True) as resp:
+            url_final = resp.url or url
+            if resp.status_code != 200:
+                return None, 0, [], url_final
+
+            for chunk in _ler_chunks(resp):
+                if not chunk:
+                    continue
+                bytes_descompactados += len(chunk)
+                bytes_baixados = _bytes_trafegados(resp, bytes_descompactados)
+
+                # latin-1 nunca falha e preserva dígitos/pontuação ASCII
+                buffer = buffer[-SOBREPOSICAO:] + chunk.decode("latin-1")
+
+                cnpj = buscar_cnpj_no_texto(buffer)
+                if cnpj:
+                    return cnpj, bytes_baixados, list(links), url_final
+
+                if coletar_links:
+                    for href in HREF_REGEX.findall(buffer):
+                        link = _normalizar_url(urljoin(url_final, href.strip()))
+                        if link not in links and _prioridade_link(link) is not None:
+                            links[link] = None
+
+                if bytes_baixados >= limite_bytes or time.perf_counter() >= prazo:
+                    break
+    except Exception as e:
+        print(f"Erro ao acessar {url}: {e}")
+
+    return None, bytes_baixados, list(links), url_final
+
+
+# ----------------------------
+# FUNÇÕES PRINCIPAIS
+# ----------------------------
+def extrair_cnpj_com_metricas(url: str):
+    """
+    Procura o primeiro CNPJ válido do site: varre a página inicial e, só se
+    não encontrar, segue páginas prováveis ("contato", "sobre"...) do mesmo domínio.
+    Retorna um dicionário com o CNPJ, bytes baixados (trafegados na rede),
+    tempo gasto e páginas visitadas.
+    """
+    inicio = time.perf_counter()
+    prazo = inicio + TEMPO_LIMITE_POR_SITE
+    resultado = {"cnpj": None, "bytes_baixados": 0, "tempo_s": 0.0, "paginas_visitadas": []}
+
+    fila = [url]
+    visitadas = set()
+    extras_enfileirados = False
+
+    while fila and resultado["bytes_baixados"] < LIMITE_BYTES_POR_SITE and time.perf_counter() < prazo:
+        pagina = fila.pop(0)
+        if _normalizar_url(pagina) in visitadas:
+            continue
+        visitadas.add(_normalizar_url(pagina))
+        resultado["paginas_visitadas"].append(pagina)
+
+        restante = LIMITE_BYTES_POR_SITE - resultado["bytes_baixados"]
+        cnpj, baixados, links, url_final = _varrer_pagina(
+            pagina,
+            min(LIMITE_BYTES_POR_PAGINA, restante),
+            prazo,
+            coletar_links=not extras_enfileirados,
+        )
+        resultado["bytes_baixados"] += baixados
+        visitadas.add(_normalizar_url(url_final))
+
+        if cnpj:
+            resultado["cnpj"] = cnpj
+            break
+
+        # Só a página inicial alimenta a fila; o domínio vale após redirecionamentos
+        if not extras_enfileirados:
+            extras_enfileirados = True
+            dominio = _host(url_final)
+            candidatos = [l for l in links if _host(l) == dominio and l not in visitadas]
+            candidatos.sort(key=_prioridade_link)  # sort estável: mantém a ordem da página no empate
+            fila.extend(candidatos[:MAX_PAGINAS_EXTRAS])
+
+    resultado["tempo_s"] = round(time.perf_counter() - inicio, 3)
+    return resultado
+
+
+def extrair_cnpj_do_site(url: str):
+    """
+    Retorna o primeiro CNPJ válido (formatado) encontrado no site, ou None.
+    CNPJs com dígitos verificadores inválidos são descartados antes de qualquer consulta.
+    """
+    return extrair_cnpj_com_metricas(url)["cnpj"]
+
+
+# ----------------------------
+# TESTE RÁPIDO (opcional)
+# ----------------------------
+if __name__ == "__main__":
+    # Checagem offline: número solto (GTIN) antes do CNPJ formatado não pode vencer
+    pagina_teste = "produto GTIN 12345678000195 ... Contato: 11.222.333/0001-81"
+    assert validar_cnpj("12345678000195")
+    assert buscar_cnpj_no_texto(pagina_teste) == "11.222.333/0001-81"
+    assert buscar_cnpj_no_texto("produto GTIN 12345678000195") is None
+    assert buscar_cnpj_no_texto("CNPJ: 11222333000181") == "11.222.333/0001-81"
+    assert _prioridade_link("https://x.com.br/sobremesa") is None
+    assert _prioridade_link("https://x.com.br/blog/como-escolher-empresa-boa") is None
+    assert _normalizar_url(urljoin("https://x.com.br/", "contato/")) == _normalizar_url("https://x.com.br/contato")
+
+    site_teste = "https://www.coopermetal.com.br"
+    metricas = extrair_cnpj_com_metricas(site_teste)
+    print("✅ Resultado da extração:")
+    for k, v in metricas.items():
+        print(f"{k}: {v}")